@@ -22,14 +22,120 @@ Examples:
     python parse_ui.py /tmp/screen.xml --compact
 """
 
-import xml.etree.ElementTree as ET
 import json
+import mmap
+import os
+import re
 import sys
 import argparse
-from typing import List, Dict
+from dataclasses import asdict, dataclass
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
+try:
+    # lxml's C-backed parser is considerably faster on large dumps
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
-def get_interactive_elements(xml_content: str, verbose: bool = False) -> List[Dict]:
+try:
+    # orjson serialises large element lists much faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bounds format: "[x1,y1][x2,y2]"
+_BOUNDS_RE = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+ACTION_ICONS = {"tap": "👆", "type": "⌨️", "scroll": "📜", "read": "👁️"}
+
+
+@dataclass
+class UIElement:
+    """An interactive element extracted from a UI dump."""
+
+    # Explicit slots keep per-element memory low (dataclass(slots=True)
+    # needs Python 3.10+)
+    __slots__ = ("id", "text", "type", "bounds", "center", "clickable", "focusable", "editable", "action")
+
+    id: str
+    text: str
+    type: str
+    bounds: str
+    center: Tuple[int, int]
+    clickable: bool
+    focusable: bool
+    editable: bool
+    action: str
+
+
+def _element_from_attrib(a, verbose: bool = False) -> Optional[UIElement]:
+    """
+    Build a UIElement from a node's attributes.
+
+    Returns None if the node should be skipped (empty container, zero area,
+    off-screen or malformed bounds).
+    """
+    get = a.get
+    class_name = get("class", "")
+    is_clickable = get("clickable") == "true"
+    is_focusable = get("focusable") == "true"
+    is_editable = class_name.endswith("EditText")
+    text = get("text", "")
+    desc = get("content-desc", "")
+
+    # Skip empty containers unless verbose mode. Most nodes in a dump are
+    # plain layout containers, so reject them before reading anything else.
+    if not verbose:
+        if not is_clickable and not is_focusable and not is_editable and not text and not desc:
+            return None
+
+    bounds = get("bounds")
+    if not bounds:
+        return None
+
+    m = _BOUNDS_RE.match(bounds)
+    if not m:
+        return None
+    x1, y1, x2, y2 = map(int, m.groups())
+
+    # Skip elements with zero area or off-screen (x2 > x1, so x2 < 0 means
+    # the whole box is left of the screen)
+    if x2 <= x1 or y2 <= y1 or x2 < 0:
+        return None
+
+    center_x = (x1 + x2) // 2
+    center_y = (y1 + y2) // 2
+
+    # Determine element type
+    element_type = class_name.split(".")[-1] if class_name else "Unknown"
+
+    is_scrollable = get("scrollable") == "true"
+    resource_id = get("resource-id", "")
+
+    # Determine suggested action
+    if is_editable:
+        action = "type"
+    elif is_clickable:
+        action = "tap"
+    elif is_scrollable:
+        action = "scroll"
+    else:
+        action = "read"
+
+    return UIElement(
+        id=resource_id,
+        text=text or desc,
+        type=element_type,
+        bounds=bounds,
+        center=(center_x, center_y),
+        clickable=is_clickable,
+        focusable=is_focusable,
+        editable=is_editable,
+        action=action
+    )
+
+
+def get_interactive_elements(xml_content: str, verbose: bool = False) -> List[UIElement]:
     """
     Parses Android Accessibility XML and returns a list of interactive elements.
     Calculates center coordinates (x, y) for every element.
@@ -39,10 +145,10 @@ def get_interactive_elements(xml_content: str, verbose: bool = False) -> List[Di
         verbose: If True, include all elements; if False, only interactive ones
 
     Returns:
-        List of element dictionaries with id, text, type, bounds, center, clickable, action
+        List of UIElement with id, text, type, bounds, center, clickable, action
     """
     try:
-        root = ET.fromstring(xml_content)
+        root = ET.fromstring(xml_content.encode("utf-8"))
     except ET.ParseError as e:
         print(f"Error parsing XML: {e}", file=sys.stderr)
         return []
@@ -50,117 +156,155 @@ def get_interactive_elements(xml_content: str, verbose: bool = False) -> List[Di
     elements = []
 
     for node in root.iter():
-        is_clickable = node.attrib.get("clickable") == "true"
-        is_focusable = node.attrib.get("focusable") == "true"
-        is_editable = node.attrib.get("class", "").endswith("EditText")
-        is_scrollable = node.attrib.get("scrollable") == "true"
-        text = node.attrib.get("text", "")
-        desc = node.attrib.get("content-desc", "")
-        resource_id = node.attrib.get("resource-id", "")
-
-        # Skip empty containers unless verbose mode
-        if not verbose:
-            if not is_clickable and not is_focusable and not is_editable and not text and not desc:
-                continue
+        element = _element_from_attrib(node.attrib, verbose)
+        if element is not None:
+            elements.append(element)
 
-        bounds = node.attrib.get("bounds")
-        if bounds:
-            try:
-                # Parse bounds: "[x1,y1][x2,y2]" -> coordinates
-                coords = bounds.replace("][", ",").replace("[", "").replace("]", "").split(",")
-                x1, y1, x2, y2 = map(int, coords)
-
-                # Skip elements with zero area or off-screen
-                if x2 <= x1 or y2 <= y1:
-                    continue
-                if x1 < 0 and x2 < 0:
-                    continue
-
-                center_x = (x1 + x2) // 2
-                center_y = (y1 + y2) // 2
-
-                # Determine element type
-                class_name = node.attrib.get("class", "")
-                element_type = class_name.split(".")[-1] if class_name else "Unknown"
-
-                # Determine suggested action
-                if is_editable:
-                    action = "type"
-                elif is_clickable:
-                    action = "tap"
-                elif is_scrollable:
-                    action = "scroll"
-                else:
-                    action = "read"
-
-                element = {
-                    "id": resource_id,
-                    "text": text or desc,
-                    "type": element_type,
-                    "bounds": bounds,
-                    "center": [center_x, center_y],
-                    "clickable": is_clickable,
-                    "focusable": is_focusable,
-                    "editable": is_editable,
-                    "action": action
-                }
-                elements.append(element)
-            except (ValueError, IndexError):
+    return elements
+
+
+def get_interactive_elements_stream(source: Union[str, BinaryIO, mmap.mmap], verbose: bool = False) -> List[UIElement]:
+    """
+    Streaming variant of get_interactive_elements for large dumps.
+
+    Elements are extracted as they are parsed and cleared once processed,
+    so the full tree is never held in memory.
+
+    Args:
+        source: Path to the XML file, a file object opened in binary mode,
+            or a read-only mmap of the file
+        verbose: If True, include all elements; if False, only interactive ones
+
+    Returns:
+        List of UIElement, in document order
+    """
+    elements = []
+
+    try:
+        # Attributes are complete on "start", so elements are extracted there
+        # (keeping document order) and released on "end".
+        for event, node in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                element = _element_from_attrib(node.attrib, verbose)
+                if element is not None:
+                    elements.append(element)
                 continue
 
+            node.clear()
+            # lxml keeps references to processed siblings; drop them as we go
+            # (the root has no parent, but may follow a comment or PI)
+            if hasattr(node, "getprevious"):
+                parent = node.getparent()
+                if parent is not None:
+                    while node.getprevious() is not None:
+                        del parent[0]
+    except ET.ParseError as e:
+        print(f"Error parsing XML: {e}", file=sys.stderr)
+        return []
+
     return elements
 
 
-def format_element(elem: Dict, compact: bool = False) -> str:
+def format_element(elem: UIElement, compact: bool = False) -> str:
     """Format a single element for human-readable output."""
-    text = elem['text']
+    text = elem.text
     if len(text) > 50:
         text = text[:47] + "..."
 
-    action_icon = {"tap": "👆", "type": "⌨️", "scroll": "📜", "read": "👁️"}.get(elem['action'], "")
+    action_icon = ACTION_ICONS.get(elem.action, "")
 
     parts = []
     if text:
         parts.append(f'"{text}"')
-    if elem['id']:
-        short_id = elem['id'].split("/")[-1] if "/" in elem['id'] else elem['id']
-        parts.append(f"[{short_id}]")
+    if elem.id:
+        parts.append(f"[{elem.id.rpartition('/')[2]}]")
 
-    label = " ".join(parts) if parts else elem['type']
+    label = " ".join(parts) if parts else elem.type
 
+    x, y = elem.center
     if compact:
-        return f"{action_icon} {label} @ ({elem['center'][0]}, {elem['center'][1]})"
+        return f"{action_icon} {label} @ ({x}, {y})"
     else:
-        return f"  {action_icon} {label} @ ({elem['center'][0]}, {elem['center'][1]})"
+        return f"  {action_icon} {label} @ ({x}, {y})"
+
+
+def group_by_action(elements: List[UIElement]) -> Dict[str, List[UIElement]]:
+    """Group elements by suggested action in a single pass."""
+    groups = {"tap": [], "type": [], "scroll": [], "read": []}
+    for elem in elements:
+        groups[elem.action].append(elem)
+    return groups
 
 
-def format_compact(elements: List[Dict]) -> str:
+def format_compact(elements: List[UIElement]) -> str:
     """
     Format elements in a very compact way optimised for LLM consumption.
     Groups by action type with minimal formatting.
     """
     lines = []
 
-    tappable = [e for e in elements if e['action'] == 'tap']
-    typeable = [e for e in elements if e['action'] == 'type']
-    scrollable = [e for e in elements if e['action'] == 'scroll']
+    groups = group_by_action(elements)
+    tappable = groups["tap"]
+    typeable = groups["type"]
+    scrollable = groups["scroll"]
 
     if tappable:
         lines.append("TAP:")
         for elem in tappable:
-            text = elem['text'][:40] if elem['text'] else elem['id'].split("/")[-1] if elem['id'] else elem['type']
-            lines.append(f"  [{elem['center'][0]},{elem['center'][1]}] {text}")
+            x, y = elem.center
+            text = elem.text[:40] if elem.text else elem.id.rpartition("/")[2] if elem.id else elem.type
+            lines.append(f"  [{x},{y}] {text}")
 
     if typeable:
         lines.append("TYPE:")
         for elem in typeable:
-            text = elem['text'][:40] if elem['text'] else elem['id'].split("/")[-1] if elem['id'] else "input"
-            lines.append(f"  [{elem['center'][0]},{elem['center'][1]}] {text}")
+            x, y = elem.center
+            text = elem.text[:40] if elem.text else elem.id.rpartition("/")[2] if elem.id else "input"
+            lines.append(f"  [{x},{y}] {text}")
 
     if scrollable:
         lines.append("SCROLL:")
         for elem in scrollable:
-            lines.append(f"  [{elem['center'][0]},{elem['center'][1]}] {elem['type']}")
+            x, y = elem.center
+            lines.append(f"  [{x},{y}] {elem.type}")
+
+    return "\n".join(lines)
+
+
+def format_grouped(elements: List[UIElement]) -> str:
+    """
+    Format elements in a human-readable way, grouped by action type.
+    Read-only elements are limited to the first 10.
+    """
+    lines = [f"\n📱 Found {len(elements)} interactive elements:\n"]
+
+    groups = group_by_action(elements)
+    tappable = groups["tap"]
+    typeable = groups["type"]
+    scrollable = groups["scroll"]
+    readable = groups["read"]
+
+    if tappable:
+        lines.append("TAPPABLE:")
+        lines.extend(format_element(elem) for elem in tappable)
+        lines.append("")
+
+    if typeable:
+        lines.append("INPUT FIELDS:")
+        lines.extend(format_element(elem) for elem in typeable)
+        lines.append("")
+
+    if scrollable:
+        lines.append("SCROLLABLE:")
+        lines.extend(format_element(elem) for elem in scrollable)
+        lines.append("")
+
+    if readable:
+        lines.append("TEXT/INFO:")
+        lines.extend(format_element(elem) for elem in readable[:10])  # Limit readable to 10
+        if len(readable) > 10:
+            lines.append(f"  ... and {len(readable) - 10} more")
+        lines.append("")
 
     return "\n".join(lines)
 
@@ -176,8 +320,15 @@ def main():
     args = parser.parse_args()
 
     try:
-        with open(args.xml_file, "r", encoding="utf-8") as f:
-            xml_content = f.read()
+        with open(args.xml_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                # Parse straight from the page cache rather than reading the
+                # file into Python buffers
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    elements = get_interactive_elements_stream(mm, verbose=args.verbose)
+            else:
+                # Empty files cannot be mapped; let the parser report them
+                elements = get_interactive_elements_stream(f, verbose=args.verbose)
     except FileNotFoundError:
         print(f"Error: File not found: {args.xml_file}", file=sys.stderr)
         sys.exit(1)
@@ -185,51 +336,19 @@ def main():
         print(f"Error reading file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    elements = get_interactive_elements(xml_content, verbose=args.verbose)
-
     if not elements:
         print("No interactive elements found. Screen may be loading or empty.", file=sys.stderr)
         sys.exit(0)
 
     if args.json:
-        print(json.dumps(elements, indent=2))
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(elements, option=orjson.OPT_INDENT_2) + b"\n")
+        else:
+            print(json.dumps([asdict(e) for e in elements], indent=2))
     elif args.compact:
         print(format_compact(elements))
     else:
-        # Human-readable format grouped by action
-        print(f"\n📱 Found {len(elements)} interactive elements:\n")
-
-        # Group by action type
-        tappable = [e for e in elements if e['action'] == 'tap']
-        typeable = [e for e in elements if e['action'] == 'type']
-        scrollable = [e for e in elements if e['action'] == 'scroll']
-        readable = [e for e in elements if e['action'] == 'read']
-
-        if tappable:
-            print("TAPPABLE:")
-            for elem in tappable:
-                print(format_element(elem))
-            print()
-
-        if typeable:
-            print("INPUT FIELDS:")
-            for elem in typeable:
-                print(format_element(elem))
-            print()
-
-        if scrollable:
-            print("SCROLLABLE:")
-            for elem in scrollable:
-                print(format_element(elem))
-            print()
-
-        if readable:
-            print("TEXT/INFO:")
-            for elem in readable[:10]:  # Limit readable to 10
-                print(format_element(elem))
-            if len(readable) > 10:
-                print(f"  ... and {len(readable) - 10} more")
-            print()
+        print(format_grouped(elements))
 
 
 if __name__ == "__main__":
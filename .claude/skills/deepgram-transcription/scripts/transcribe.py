@@ -3,7 +3,8 @@
 Deepgram Audio/Video Transcription Script
 
 This script handles transcription of audio and video files using the Deepgram API.
-For large video files, it first extracts audio to reduce upload size and time.
+For large video files, it extracts audio with ffmpeg and streams it straight to
+the API to reduce upload size and time.
 """
 
 import argparse
@@ -11,8 +12,20 @@ import json
 import os
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # orjson writes large transcription responses much faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared session so repeated calls reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 
 def extract_audio(video_path, output_path, bitrate="128k"):
@@ -85,10 +98,12 @@ def transcribe_with_deepgram(file_path, api_key, model="nova-2", smart_format=Tr
     }
 
     try:
+        # Passing the open file streams it from disk; requests sizes it for
+        # Content-Length, so large audio files are never buffered in memory
         with open(file_path, 'rb') as f:
-            response = requests.post(url, headers=headers, data=f, timeout=300)
-            response.raise_for_status()
-            return response.json()
+            response = _SESSION.post(url, headers=headers, data=f, timeout=300)
+        response.raise_for_status()
+        return response.json()
     except requests.exceptions.RequestException as e:
         print(f"Error calling Deepgram API: {e}", file=sys.stderr)
         return None
@@ -97,6 +112,69 @@ def transcribe_with_deepgram(file_path, api_key, model="nova-2", smart_format=Tr
         return None
 
 
+def transcribe_with_deepgram_stream(cmd, api_key, model="nova-2", smart_format=True):
+    """
+    Transcribe the output of an ffmpeg command without writing it to disk.
+
+    The command's stdout is streamed straight into the Deepgram request, so
+    encoding and uploading overlap.
+
+    Args:
+        cmd: ffmpeg command writing ADTS AAC audio to stdout (pipe:1)
+        api_key: Deepgram API key
+        model: Deepgram model to use (default: nova-2)
+        smart_format: Enable smart formatting (default: True)
+
+    Returns:
+        dict: Transcription result from Deepgram API, or None if failed
+    """
+    url = f"https://api.deepgram.com/v1/listen?model={model}&smart_format={str(smart_format).lower()}"
+
+    headers = {
+        "Authorization": f"Token {api_key}",
+        "Content-Type": "audio/aac"
+    }
+
+    # stderr goes to a temp file rather than a pipe: nothing reads it until the
+    # upload is done, and a full pipe would stall ffmpeg (and with it the upload)
+    stderr_file = tempfile.TemporaryFile()
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+    except FileNotFoundError:
+        stderr_file.close()
+        print("Error: ffmpeg not found. Please install ffmpeg.", file=sys.stderr)
+        return None
+
+    def read_audio(chunk_size=1 << 20):
+        while True:
+            chunk = proc.stdout.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    with stderr_file:
+        try:
+            response = _SESSION.post(url, headers=headers, data=read_audio(), timeout=300)
+        except requests.exceptions.RequestException as e:
+            proc.kill()
+            proc.wait()
+            print(f"Error calling Deepgram API: {e}", file=sys.stderr)
+            return None
+
+        proc.stdout.close()
+        if proc.wait() != 0:
+            stderr_file.seek(0)
+            print(f"Error extracting audio: {stderr_file.read().decode(errors='replace')}", file=sys.stderr)
+            return None
+
+    try:
+        response.raise_for_status()
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        print(f"Error calling Deepgram API: {e}", file=sys.stderr)
+        return None
+
+
 def save_transcription(result, output_dir, base_name):
     """
     Save transcription results to JSON and text files.
@@ -111,8 +189,11 @@ def save_transcription(result, output_dir, base_name):
 
     # Save full JSON response
     json_path = output_dir / f"{base_name}_transcription.json"
-    with open(json_path, 'w') as f:
-        json.dump(result, f, indent=2)
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(result, f, indent=2)
     print(f"Saved full transcription JSON: {json_path}")
 
     # Extract and save plain text transcript
@@ -138,6 +219,8 @@ def main():
     parser.add_argument("--extract-audio", action="store_true",
                        help="Extract audio from video first (recommended for large files)")
     parser.add_argument("--audio-bitrate", default="128k", help="Audio bitrate when extracting (default: 128k)")
+    parser.add_argument("--keep-audio", action="store_true",
+                       help="Save extracted audio to the output directory instead of streaming it")
 
     args = parser.parse_args()
 
@@ -148,30 +231,50 @@ def main():
 
     # Determine file to transcribe
     file_to_transcribe = input_path
-    temp_audio_file = None
 
     # Extract audio if requested or if file is large video
     video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv'}
     file_size_mb = input_path.stat().st_size / (1024 * 1024)
 
-    if args.extract_audio or (input_path.suffix.lower() in video_extensions and file_size_mb > 50):
-        print(f"Extracting audio from {input_path.name}...")
-        temp_audio_file = Path(args.output_dir) / f"{input_path.stem}_audio.m4a"
-
-        if not extract_audio(str(input_path), str(temp_audio_file), args.audio_bitrate):
-            return 1
+    needs_extraction = args.extract_audio or (input_path.suffix.lower() in video_extensions and file_size_mb > 50)
 
-        file_to_transcribe = temp_audio_file
-        print(f"Audio extracted: {temp_audio_file} ({temp_audio_file.stat().st_size / (1024*1024):.1f} MB)")
-
-    # Transcribe
-    print(f"Transcribing {file_to_transcribe.name} using Deepgram...")
-    result = transcribe_with_deepgram(
-        str(file_to_transcribe),
-        args.api_key,
-        model=args.model,
-        smart_format=not args.no_smart_format
-    )
+    if needs_extraction and not args.keep_audio:
+        # Pipe ffmpeg's audio straight into the upload, no temporary file
+        print(f"Extracting and transcribing audio from {input_path.name} using Deepgram...")
+        cmd = [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", str(input_path),
+            "-vn",  # No video
+            "-acodec", "aac",
+            "-b:a", args.audio_bitrate,
+            "-f", "adts",
+            "pipe:1"
+        ]
+        result = transcribe_with_deepgram_stream(
+            cmd,
+            args.api_key,
+            model=args.model,
+            smart_format=not args.no_smart_format
+        )
+    else:
+        if needs_extraction:
+            print(f"Extracting audio from {input_path.name}...")
+            audio_file = Path(args.output_dir) / f"{input_path.stem}_audio.m4a"
+
+            if not extract_audio(str(input_path), str(audio_file), args.audio_bitrate):
+                return 1
+
+            file_to_transcribe = audio_file
+            print(f"Audio extracted: {audio_file} ({audio_file.stat().st_size / (1024*1024):.1f} MB)")
+
+        # Transcribe
+        print(f"Transcribing {file_to_transcribe.name} using Deepgram...")
+        result = transcribe_with_deepgram(
+            str(file_to_transcribe),
+            args.api_key,
+            model=args.model,
+            smart_format=not args.no_smart_format
+        )
 
     if result is None:
         return 1
@@ -179,11 +282,6 @@ def main():
     # Save results
     save_transcription(result, args.output_dir, input_path.stem)
 
-    # Clean up temporary audio file if created
-    if temp_audio_file and temp_audio_file.exists():
-        temp_audio_file.unlink()
-        print(f"Cleaned up temporary file: {temp_audio_file}")
-
     print("\n✅ Transcription completed successfully!")
     return 0
 
@@ -7,15 +7,21 @@ Supports multiple models, aspect ratios, and customizable output.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import base64
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from PIL import Image
 from io import BytesIO
 
+# Shared session so repeated calls reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 
 def generate_images(
     api_key: str,
@@ -50,67 +56,80 @@ def generate_images(
     # API endpoint
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:predict?key={api_key}"
 
-    # Request payload
+    # Request payload. Each request asks for a single image; multiple images
+    # are fetched with concurrent requests rather than one larger request.
     payload = {
         "instances": [{"prompt": prompt}],
         "parameters": {
-            "sampleCount": num_images,
+            "sampleCount": 1,
             "aspectRatio": aspect_ratio
         }
     }
 
-    try:
-        # Make API request
-        if verbose:
-            print("📡 Sending request to Gemini API...")
-
-        response = requests.post(
+    def request_image(_):
+        return _SESSION.post(
             url,
             json=payload,
             headers={"Content-Type": "application/json"},
             timeout=60
         )
 
-        # Check response status
-        if response.status_code != 200:
-            error_msg = f"API Error {response.status_code}: {response.text}"
-            print(f"❌ {error_msg}", file=sys.stderr)
-            sys.exit(1)
-
-        # Parse response
-        result = response.json()
-
+    try:
+        # Make API requests
         if verbose:
-            print("✅ Response received!\n")
+            print("📡 Sending request to Gemini API...")
 
-        # Extract and save images
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=num_images) as executor:
+            responses = list(executor.map(request_image, range(num_images)))
+
+            # Check response status and parse responses
+            predictions = []
+            for response in responses:
+                if response.status_code != 200:
+                    error_msg = f"API Error {response.status_code}: {response.text}"
+                    print(f"❌ {error_msg}", file=sys.stderr)
+                    sys.exit(1)
+                predictions.extend(response.json().get("predictions", []))
+
+            if verbose:
+                print("✅ Response received!\n")
+
+            if not predictions:
+                print("❌ No images found in API response", file=sys.stderr)
+                sys.exit(1)
+
+            # Extract and save images
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+
+            def save_image(item):
+                i, prediction = item
+                if "bytesBase64Encoded" not in prediction:
+                    return None
+
+                # Decode base64 image. The API returns encoded PNG bytes, so
+                # write them as-is rather than re-encoding through PIL.
+                image_data = base64.b64decode(prediction["bytesBase64Encoded"])
+                filepath = output_path / f"gemini_image_{timestamp}_{i+1}.png"
+                filepath.write_bytes(image_data)
+
+                size = None
+                if verbose:
+                    # Only reads the image header, pixel data is not decoded
+                    with Image.open(BytesIO(image_data)) as image:
+                        size = image.size
+                return filepath, size
+
+            saved = [r for r in executor.map(save_image, enumerate(predictions)) if r is not None]
 
         saved_files = []
+        for filepath, size in saved:
+            saved_files.append(str(filepath))
 
-        if "predictions" in result:
-            for i, prediction in enumerate(result["predictions"]):
-                if "bytesBase64Encoded" in prediction:
-                    # Decode base64 image
-                    image_data = base64.b64decode(prediction["bytesBase64Encoded"])
-                    image = Image.open(BytesIO(image_data))
-
-                    # Generate filename
-                    filename = f"gemini_image_{timestamp}_{i+1}.png"
-                    filepath = output_path / filename
-
-                    # Save image
-                    image.save(filepath)
-                    saved_files.append(str(filepath))
-
-                    if verbose:
-                        print(f"✅ Saved: {filepath}")
-                        print(f"   Size: {image.size}")
-        else:
-            print("❌ No images found in API response", file=sys.stderr)
-            sys.exit(1)
+            if verbose:
+                print(f"✅ Saved: {filepath}")
+                print(f"   Size: {size}")
 
         if verbose:
             print(f"\n🎉 Generated {len(saved_files)} image(s) successfully!")
@@ -44,6 +44,11 @@ SOCIAL_MEDIA_KEYS = [
     ("TWITTER_BEARER_TOKEN", "Twitter/X API"),
 ]
 
+REQUIRED_KEY_NAMES = frozenset(k for k, _ in REQUIRED_KEYS)
+OPTIONAL_KEY_NAMES = frozenset(k for k, _, _, _ in OPTIONAL_API_KEYS)
+LINKEDIN_KEYS = frozenset(k for k, _ in SOCIAL_MEDIA_KEYS if 'LINKEDIN' in k)
+TWITTER_KEYS = frozenset(k for k, _ in SOCIAL_MEDIA_KEYS if 'TWITTER' in k)
+
 
 def load_config():
     """Load configuration file as dictionary."""
@@ -51,31 +56,36 @@ def load_config():
         return None
 
     config = {}
-    with open(CONFIG_PATH, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' in line:
-                key, value = line.split('=', 1)
-                config[key.strip()] = value.strip()
+    for line in CONFIG_PATH.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        key, sep, value = line.partition('=')
+        if sep:
+            config[key.rstrip()] = value.lstrip()
     return config
 
 
-def check_required(config, verbose=False):
+def configured_keys(config):
+    """Return the set of keys that have a non-empty value."""
+    return {key for key, value in config.items() if value}
+
+
+def check_required(config, present, verbose=False):
     """Check required configuration keys."""
-    issues = []
+    missing = REQUIRED_KEY_NAMES - present
 
-    for key, description in REQUIRED_KEYS:
-        value = config.get(key, '')
-        if not value:
-            issues.append(f"Missing: {key} ({description})")
-        elif verbose:
-            # Mask sensitive values
-            masked = value[:4] + '...' + value[-4:] if len(value) > 10 else '***'
-            print(f"  [OK] {key}: {masked}")
+    if verbose:
+        for key, _ in REQUIRED_KEYS:
+            if key not in missing:
+                # Mask sensitive values
+                value = config[key]
+                masked = value[:4] + '...' + value[-4:] if len(value) > 10 else '***'
+                print(f"  [OK] {key}: {masked}")
 
-    return issues
+    if not missing:
+        return []
+    return [f"Missing: {key} ({description})" for key, description in REQUIRED_KEYS if key in missing]
 
 
 def validate_telegram_token(config):
@@ -97,32 +107,23 @@ def validate_telegram_user_id(config):
     return None
 
 
-def check_optional_keys(config, verbose=False):
+def check_optional_keys(present, verbose=False):
     """Check optional API keys."""
-    configured = []
-    missing = []
-
-    for item in OPTIONAL_API_KEYS:
-        key, description, url, free_tier = item
-        if config.get(key):
-            configured.append(key)
-            if verbose:
-                print(f"  [OK] {key}")
-        else:
-            missing.append((key, description, url, free_tier))
+    found = OPTIONAL_KEY_NAMES & present
 
-    return configured, missing
+    configured = [item[0] for item in OPTIONAL_API_KEYS if item[0] in found]
+    missing = [item for item in OPTIONAL_API_KEYS if item[0] not in found]
 
+    if verbose:
+        for key in configured:
+            print(f"  [OK] {key}")
 
-def check_social_media(config, verbose=False):
-    """Check social media API keys."""
-    linkedin_keys = [k for k, _ in SOCIAL_MEDIA_KEYS if 'LINKEDIN' in k]
-    twitter_keys = [k for k, _ in SOCIAL_MEDIA_KEYS if 'TWITTER' in k]
+    return configured, missing
 
-    linkedin_configured = all(config.get(k) for k in linkedin_keys)
-    twitter_configured = all(config.get(k) for k in twitter_keys)
 
-    return linkedin_configured, twitter_configured
+def check_social_media(present):
+    """Check social media API keys."""
+    return LINKEDIN_KEYS <= present, TWITTER_KEYS <= present
 
 
 def check_directories():
@@ -176,7 +177,8 @@ def main():
     # Check required keys
     print("Required Configuration:")
     print("-" * 40)
-    issues = check_required(config, verbose)
+    present = configured_keys(config)
+    issues = check_required(config, present, verbose)
 
     if issues:
         for issue in issues:
@@ -207,7 +209,7 @@ def main():
     # Check optional API keys
     print("Optional API Keys:")
     print("-" * 40)
-    configured, missing = check_optional_keys(config, verbose)
+    configured, missing = check_optional_keys(present, verbose)
 
     if configured:
         print(f"  Configured: {', '.join(configured)}")
@@ -224,7 +226,7 @@ def main():
     # Check social media
     print("Social Media Integration:")
     print("-" * 40)
-    linkedin, twitter = check_social_media(config, verbose)
+    linkedin, twitter = check_social_media(present)
     print(f"  LinkedIn: {'Configured' if linkedin else 'Not configured'}")
     print(f"  Twitter/X: {'Configured' if twitter else 'Not configured'}")
     print()
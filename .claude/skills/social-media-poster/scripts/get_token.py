@@ -5,9 +5,10 @@ Helps you get an access token for the LinkedIn API.
 """
 
 import os
+import threading
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, urlencode, quote
 import requests
 from dotenv import load_dotenv
 
@@ -18,6 +19,18 @@ CLIENT_SECRET = os.getenv("LINKEDIN_CLIENT_SECRET")
 REDIRECT_URI = "http://localhost:8000/callback"
 SCOPES = "openid profile email w_member_social"
 
+TOKEN_URL = "https://www.linkedin.com/oauth/v2/accessToken"
+# Built once; every parameter is percent-encoded (spaces in SCOPES become %20)
+AUTH_URL = "https://www.linkedin.com/oauth/v2/authorization?" + urlencode(
+    {
+        "response_type": "code",
+        "client_id": CLIENT_ID or "",
+        "redirect_uri": REDIRECT_URI,
+        "scope": SCOPES,
+    },
+    quote_via=quote
+)
+
 class CallbackHandler(BaseHTTPRequestHandler):
     """Handle OAuth callback from LinkedIn."""
 
@@ -33,6 +46,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
                 self.end_headers()
                 self.wfile.write(f"Error: {params['error'][0]}".encode())
                 self.server.auth_code = None
+                self._stop_server()
                 return
 
             if "code" in params:
@@ -46,31 +60,32 @@ class CallbackHandler(BaseHTTPRequestHandler):
                     <p>You can close this window and return to the terminal.</p>
                     </body></html>
                 """)
+                self._stop_server()
                 return
 
         self.send_response(404)
         self.end_headers()
 
+    def _stop_server(self):
+        """Stop serve_forever() once the OAuth callback has been handled."""
+        # shutdown() blocks until the serve loop exits, so it must not run
+        # on the thread that is handling this request
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+
     def log_message(self, format, *args):
         """Suppress logging."""
         pass
 
 
 def get_authorization_url() -> str:
-    """Build the LinkedIn authorization URL."""
-    return (
-        f"https://www.linkedin.com/oauth/v2/authorization"
-        f"?response_type=code"
-        f"&client_id={CLIENT_ID}"
-        f"&redirect_uri={REDIRECT_URI}"
-        f"&scope={SCOPES}"
-    )
+    """Return the LinkedIn authorization URL."""
+    return AUTH_URL
 
 
 def exchange_code_for_token(auth_code: str) -> dict:
     """Exchange the authorization code for an access token."""
     response = requests.post(
-        "https://www.linkedin.com/oauth/v2/accessToken",
+        TOKEN_URL,
         data={
             "grant_type": "authorization_code",
             "code": auth_code,
@@ -109,9 +124,9 @@ def main():
 
     print("Waiting for authorization...")
 
-    # Handle the callback
-    while server.auth_code is None:
-        server.handle_request()
+    # Handle requests until the callback handler stops the server
+    server.serve_forever()
+    server.server_close()
 
     if server.auth_code:
         print("\nExchanging code for access token...")
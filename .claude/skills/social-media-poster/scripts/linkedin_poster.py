@@ -7,19 +7,183 @@ Posts text, images, videos, and links to your LinkedIn profile.
 import os
 import json
 import time
+import logging
+import random
+import hashlib
+import mmap
+import tempfile
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
 from typing import Optional, List
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+try:
+    # orjson serialises request payloads considerably faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
 # LinkedIn API version - update as needed
 LINKEDIN_VERSION = "202411"
 
+# API endpoints
+BASE_URL = "https://api.linkedin.com"
+USERINFO_URL = f"{BASE_URL}/v2/userinfo"
+UGC_POSTS_URL = f"{BASE_URL}/v2/ugcPosts"
+ASSETS_REGISTER_URL = f"{BASE_URL}/v2/assets?action=registerUpload"
+POSTS_URL = f"{BASE_URL}/rest/posts"
+VIDEOS_URL = f"{BASE_URL}/rest/videos"
+VIDEOS_INIT_URL = f"{VIDEOS_URL}?action=initializeUpload"
+VIDEOS_FINALIZE_URL = f"{VIDEOS_URL}?action=finalizeUpload"
+
+# User URNs cached across runs, keyed by a hash of the access token
+URN_CACHE_PATH = Path.home() / ".cache" / "linkedin_poster" / "urn.json"
+
+# Upload size limits, checked locally before anything is sent
+MAX_IMAGE_BYTES = 100 * 1024 * 1024
+MAX_VIDEO_BYTES = 500 * 1024 * 1024
+
+# Leading box types of MP4/MOV files (found at offset 4) and the EBML magic
+# that starts Matroska/WebM files
+_VIDEO_BOX_TYPES = (b"ftyp", b"moov", b"mdat", b"free", b"wide")
+_EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+
+# Shared, never mutated: only ever serialised into request bodies
+_PUBLIC_VISIBILITY = {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"}
+
+
+def _json_body(payload: dict) -> bytes:
+    """Serialise a request payload (callers send Content-Type: application/json)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _validate_files(paths: list, max_bytes: int, video: bool = False) -> list:
+    """
+    Check that every file exists, is non-empty and within max_bytes.
+
+    With video=True the container signature is sniffed as well. All problems
+    are collected into a single ValueError; on success the file sizes are returned.
+    """
+    errors = []
+    sizes = []
+    for path in paths:
+        try:
+            size = os.stat(path).st_size
+        except OSError as e:
+            errors.append(f"{path}: {e.strerror}")
+            continue
+
+        if size == 0:
+            errors.append(f"{path}: file is empty")
+        elif size > max_bytes:
+            errors.append(f"{path}: {size / 1024 / 1024:.1f} MB exceeds the {max_bytes // 1024 // 1024} MB limit")
+        elif video:
+            with open(path, "rb") as f:
+                header = f.read(12)
+            if header[4:8] not in _VIDEO_BOX_TYPES and not header.startswith(_EBML_MAGIC):
+                errors.append(f"{path}: not a recognised video container (MP4/MOV/MKV/WebM)")
+        sizes.append(size)
+
+    if errors:
+        raise ValueError("Invalid upload file(s):\n  " + "\n  ".join(errors))
+    return sizes
+
+
+def _extract_post_id(response: requests.Response) -> dict:
+    """
+    Return {"id": ...} for a create call, preferring the x-restli-id header
+    LinkedIn sets on every create so the body normally isn't parsed.
+    """
+    post_id = response.headers.get("x-restli-id")
+    if not post_id and response.content:
+        post_id = response.json().get("id")
+    return {"id": post_id or "posted"}
+
+
+def _ugc_payload(author: str, share_content: dict) -> dict:
+    """Build a published, public ugcPosts payload around the given share content."""
+    return {
+        "author": author,
+        "lifecycleState": "PUBLISHED",
+        "specificContent": {
+            "com.linkedin.ugc.ShareContent": share_content
+        },
+        "visibility": _PUBLIC_VISIBILITY
+    }
+
+
+class _PostSafeRetry(Retry):
+    """
+    Retry policy that only retries a POST on 429: the request was rejected
+    before LinkedIn acted on it, whereas retrying after a 5xx could publish twice.
+    POST is left out of allowed_methods, so read errors never resend it either.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _retrying_adapter(pool_maxsize: int) -> HTTPAdapter:
+    """HTTPAdapter that backs off and retries transient 429/5xx responses."""
+    retry = _PostSafeRetry(
+        total=4,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        # Hand the last response back so raise_for_status() reports it as before
+        raise_on_status=False
+    )
+    return HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=pool_maxsize)
+
+
+class _BufferRange:
+    """
+    File-like view of `size` bytes of a buffer starting at `start`, for
+    streaming uploads. Reads slice the buffer by index, so several ranges
+    can share one mmap across threads. Seekable, so retries can rewind it.
+    """
+
+    def __init__(self, buf, start: int, size: int):
+        self._buf = buf
+        self._start = start
+        self._pos = start
+        self._end = start + size
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def tell(self) -> int:
+        return self._pos - self._start
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: self._start, os.SEEK_CUR: self._pos, os.SEEK_END: self._end}[whence]
+        self._pos = max(self._start, min(base + offset, self._end))
+        return self.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._end - self._pos
+        end = min(self._pos + size, self._end)
+        data = self._buf[self._pos:end]
+        self._pos = end
+        return data
+
+
 class LinkedInPoster:
     """Handles posting content to LinkedIn via the API."""
 
-    BASE_URL = "https://api.linkedin.com"
+    BASE_URL = BASE_URL
 
     def __init__(self):
         self.access_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
@@ -34,47 +198,79 @@ class LinkedInPoster:
         }
         self.user_urn = None
 
+        # Keep-alive session for api.linkedin.com calls
+        self.session = requests.Session()
+        self.session.mount("https://", _retrying_adapter(pool_maxsize=16))
+        self.session.headers.update(self.headers)
+        self.session.hooks["response"].append(self._on_response)
+
+        # Separate pool for media uploads, which go to a different host
+        self.upload_session = requests.Session()
+        self.upload_session.mount("https://", _retrying_adapter(pool_maxsize=16))
+
+    def _urn_cache_key(self) -> str:
+        return hashlib.sha256(self.access_token.encode()).hexdigest()[:16]
+
+    def _read_urn_cache(self) -> dict:
+        try:
+            return json.loads(URN_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_urn_cache(self, cache: dict) -> None:
+        """Atomically replace the URN cache file. Failures are ignored."""
+        try:
+            URN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=URN_CACHE_PATH.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, URN_CACHE_PATH)
+        except OSError:
+            pass
+
+    def _on_response(self, response, *args, **kwargs):
+        """Drop the cached URN when the token is rejected."""
+        if response.status_code == 401:
+            self.user_urn = None
+            cache = self._read_urn_cache()
+            if cache.pop(self._urn_cache_key(), None) is not None:
+                self._write_urn_cache(cache)
+
     def get_user_profile(self) -> str:
         """Get the current user's URN (unique identifier)."""
         if self.user_urn:
             return self.user_urn
 
-        response = requests.get(
-            f"{self.BASE_URL}/v2/userinfo",
-            headers=self.headers
-        )
+        # Avoid the userinfo round-trip if this token was seen before
+        cache = self._read_urn_cache()
+        cached_urn = cache.get(self._urn_cache_key())
+        if cached_urn:
+            self.user_urn = cached_urn
+            return self.user_urn
+
+        response = self.session.get(USERINFO_URL)
         response.raise_for_status()
         data = response.json()
         self.user_urn = f"urn:li:person:{data['sub']}"
+
+        cache[self._urn_cache_key()] = self.user_urn
+        self._write_urn_cache(cache)
         return self.user_urn
 
     def post_text(self, text: str) -> dict:
         """Post a text-only update to LinkedIn."""
         author = self.get_user_profile()
 
-        payload = {
-            "author": author,
-            "lifecycleState": "PUBLISHED",
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {
-                        "text": text
-                    },
-                    "shareMediaCategory": "NONE"
-                }
+        payload = _ugc_payload(author, {
+            "shareCommentary": {
+                "text": text
             },
-            "visibility": {
-                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-            }
-        }
+            "shareMediaCategory": "NONE"
+        })
 
-        response = requests.post(
-            f"{self.BASE_URL}/v2/ugcPosts",
-            headers=self.headers,
-            json=payload
-        )
+        response = self.session.post(UGC_POSTS_URL, data=_json_body(payload))
         response.raise_for_status()
-        return response.json()
+        return _extract_post_id(response)
 
     def post_with_link(self, text: str, url: str, title: Optional[str] = None, description: Optional[str] = None) -> dict:
         """Post an update with a link preview."""
@@ -89,34 +285,21 @@ class LinkedInPoster:
         if description:
             media["description"] = {"text": description}
 
-        payload = {
-            "author": author,
-            "lifecycleState": "PUBLISHED",
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {
-                        "text": text
-                    },
-                    "shareMediaCategory": "ARTICLE",
-                    "media": [media]
-                }
+        payload = _ugc_payload(author, {
+            "shareCommentary": {
+                "text": text
             },
-            "visibility": {
-                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-            }
-        }
+            "shareMediaCategory": "ARTICLE",
+            "media": [media]
+        })
 
-        response = requests.post(
-            f"{self.BASE_URL}/v2/ugcPosts",
-            headers=self.headers,
-            json=payload
-        )
+        response = self.session.post(UGC_POSTS_URL, data=_json_body(payload))
         response.raise_for_status()
-        return response.json()
+        return _extract_post_id(response)
 
-    def _register_image_upload(self) -> tuple[str, str]:
+    def _register_image_upload(self, author: Optional[str] = None) -> tuple[str, str]:
         """Register an image upload and get the upload URL."""
-        author = self.get_user_profile()
+        author = author or self.get_user_profile()
 
         payload = {
             "registerUploadRequest": {
@@ -131,11 +314,7 @@ class LinkedInPoster:
             }
         }
 
-        response = requests.post(
-            f"{self.BASE_URL}/v2/assets?action=registerUpload",
-            headers=self.headers,
-            json=payload
-        )
+        response = self.session.post(ASSETS_REGISTER_URL, data=_json_body(payload))
         response.raise_for_status()
         data = response.json()
 
@@ -146,25 +325,31 @@ class LinkedInPoster:
 
     def _upload_image(self, upload_url: str, image_path: str) -> None:
         """Upload an image to LinkedIn's servers."""
-        with open(image_path, "rb") as f:
-            image_data = f.read()
-
         upload_headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/octet-stream"
         }
 
-        response = requests.put(upload_url, headers=upload_headers, data=image_data)
+        # Stream the file rather than reading it into memory first
+        with open(image_path, "rb") as f:
+            response = self.upload_session.put(upload_url, headers=upload_headers, data=f)
         response.raise_for_status()
 
+    def _register_and_upload_image(self, image_path: str, author: Optional[str] = None) -> str:
+        """Register an image upload, upload the file and return the asset URN."""
+        upload_url, asset = self._register_image_upload(author)
+        self._upload_image(upload_url, image_path)
+        return asset
+
     def post_with_image(self, text: str, image_path: str, title: Optional[str] = None, description: Optional[str] = None) -> dict:
         """Post an update with an image attachment."""
-        # Register and upload image
-        upload_url, asset = self._register_image_upload()
-        self._upload_image(upload_url, image_path)
+        _validate_files([image_path], MAX_IMAGE_BYTES)
 
         author = self.get_user_profile()
 
+        # Register and upload image
+        asset = self._register_and_upload_image(image_path, author)
+
         media = {
             "status": "READY",
             "media": asset
@@ -174,48 +359,34 @@ class LinkedInPoster:
         if description:
             media["description"] = {"text": description}
 
-        payload = {
-            "author": author,
-            "lifecycleState": "PUBLISHED",
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {
-                        "text": text
-                    },
-                    "shareMediaCategory": "IMAGE",
-                    "media": [media]
-                }
+        payload = _ugc_payload(author, {
+            "shareCommentary": {
+                "text": text
             },
-            "visibility": {
-                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-            }
-        }
+            "shareMediaCategory": "IMAGE",
+            "media": [media]
+        })
 
-        response = requests.post(
-            f"{self.BASE_URL}/v2/ugcPosts",
-            headers=self.headers,
-            json=payload
-        )
+        response = self.session.post(UGC_POSTS_URL, data=_json_body(payload))
         response.raise_for_status()
-        return response.json()
+        return _extract_post_id(response)
 
     def post_with_images(self, text: str, image_paths: list, title: Optional[str] = None, description: Optional[str] = None) -> dict:
         """Post an update with multiple image attachments (up to 9 on LinkedIn)."""
         if len(image_paths) > 9:
             raise ValueError("LinkedIn allows maximum 9 images per post")
+        _validate_files(image_paths, MAX_IMAGE_BYTES)
 
         author = self.get_user_profile()
-        media_list = []
-
-        # Upload each image
-        for image_path in image_paths:
-            upload_url, asset = self._register_image_upload()
-            self._upload_image(upload_url, image_path)
-            media = {
-                "status": "READY",
-                "media": asset
-            }
-            media_list.append(media)
+
+        # Register and upload all images concurrently (map keeps their order)
+        with ThreadPoolExecutor(max_workers=min(9, len(image_paths)) or 1) as executor:
+            assets = list(executor.map(
+                lambda image_path: self._register_and_upload_image(image_path, author),
+                image_paths
+            ))
+
+        media_list = [{"status": "READY", "media": asset} for asset in assets]
 
         # Add title/description to first image only
         if title and media_list:
@@ -223,36 +394,23 @@ class LinkedInPoster:
         if description and media_list:
             media_list[0]["description"] = {"text": description}
 
-        payload = {
-            "author": author,
-            "lifecycleState": "PUBLISHED",
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {
-                        "text": text
-                    },
-                    "shareMediaCategory": "IMAGE",
-                    "media": media_list
-                }
+        payload = _ugc_payload(author, {
+            "shareCommentary": {
+                "text": text
             },
-            "visibility": {
-                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-            }
-        }
+            "shareMediaCategory": "IMAGE",
+            "media": media_list
+        })
 
-        response = requests.post(
-            f"{self.BASE_URL}/v2/ugcPosts",
-            headers=self.headers,
-            json=payload
-        )
+        response = self.session.post(UGC_POSTS_URL, data=_json_body(payload))
         response.raise_for_status()
-        return response.json()
+        return _extract_post_id(response)
 
     # ==================== VIDEO UPLOAD METHODS ====================
 
-    def _initialize_video_upload(self, file_size: int) -> dict:
+    def _initialize_video_upload(self, file_size: int, author: Optional[str] = None) -> dict:
         """Initialize video upload and get upload URLs."""
-        author = self.get_user_profile()
+        author = author or self.get_user_profile()
 
         payload = {
             "initializeUploadRequest": {
@@ -263,52 +421,55 @@ class LinkedInPoster:
             }
         }
 
+        response = self.session.post(
+            VIDEOS_INIT_URL,
+            data=_json_body(payload)
+        )
+        response.raise_for_status()
+        return response.json()["value"]
+
+    def _upload_video_chunk(self, video_data: mmap.mmap, instruction: dict) -> str:
+        """Upload a single video chunk from the mapped file and return its ETag."""
+        first_byte = instruction["firstByte"]
+        last_byte = instruction["lastByte"]
+
+        chunk_size = last_byte - first_byte + 1
+
+        # Upload the chunk, streaming it from the mapped file
         headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-            "X-Restli-Protocol-Version": "2.0.0",
-            "LinkedIn-Version": LINKEDIN_VERSION
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(chunk_size)
         }
 
-        response = requests.post(
-            f"{self.BASE_URL}/rest/videos?action=initializeUpload",
+        response = self.upload_session.put(
+            instruction["uploadUrl"],
             headers=headers,
-            json=payload
+            data=_BufferRange(video_data, first_byte, chunk_size)
         )
         response.raise_for_status()
-        return response.json()["value"]
-
-    def _upload_video_chunks(self, video_path: str, upload_instructions: list) -> list:
-        """Upload video in chunks and return ETags."""
-        etags = []
-
-        with open(video_path, "rb") as f:
-            for instruction in upload_instructions:
-                first_byte = instruction["firstByte"]
-                last_byte = instruction["lastByte"]
-                upload_url = instruction["uploadUrl"]
-
-                # Seek to the correct position and read the chunk
-                f.seek(first_byte)
-                chunk_size = last_byte - first_byte + 1
-                chunk_data = f.read(chunk_size)
-
-                # Upload the chunk
-                headers = {
-                    "Content-Type": "application/octet-stream"
-                }
-
-                response = requests.put(upload_url, headers=headers, data=chunk_data)
-                response.raise_for_status()
 
-                # Get ETag from response header
-                etag = response.headers.get("etag", "").strip('"')
-                if etag:
-                    etags.append(etag)
+        logger.debug("  Uploaded chunk: bytes %d-%d", first_byte, last_byte)
 
-                print(f"  Uploaded chunk: bytes {first_byte}-{last_byte}")
+        # Get ETag from response header
+        return response.headers.get("etag", "").strip('"')
 
-        return etags
+    def _upload_video_chunks(self, video_path: str, upload_instructions: list) -> list:
+        """Upload video chunks in parallel and return ETags in chunk order."""
+        if not upload_instructions:
+            return []
+
+        # Map the file once and let every chunk read its byte range from it.
+        # Chunks go to independent upload URLs, so they can be sent concurrently;
+        # executor.map keeps results in instruction order, which LinkedIn requires.
+        with open(video_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as video_data, \
+                ThreadPoolExecutor(max_workers=min(8, len(upload_instructions))) as executor:
+            etags = list(executor.map(
+                lambda instruction: self._upload_video_chunk(video_data, instruction),
+                upload_instructions
+            ))
+
+        return [etag for etag in etags if etag]
 
     def _finalize_video_upload(self, video_urn: str, upload_token: str, etags: list) -> dict:
         """Finalize the video upload."""
@@ -320,17 +481,9 @@ class LinkedInPoster:
             }
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-            "X-Restli-Protocol-Version": "2.0.0",
-            "LinkedIn-Version": LINKEDIN_VERSION
-        }
-
-        response = requests.post(
-            f"{self.BASE_URL}/rest/videos?action=finalizeUpload",
-            headers=headers,
-            json=payload
+        response = self.session.post(
+            VIDEOS_FINALIZE_URL,
+            data=_json_body(payload)
         )
         response.raise_for_status()
         # Response may be empty on success
@@ -339,74 +492,86 @@ class LinkedInPoster:
         except:
             return {}
 
-    def _check_video_status(self, video_urn: str) -> str:
-        """Check the processing status of an uploaded video."""
+    def _check_video_status(self, video_urn: str) -> tuple[str, Optional[float]]:
+        """
+        Check the processing status of an uploaded video.
+
+        Returns the status and the server's Retry-After hint in seconds, if any.
+        """
         import urllib.parse
         encoded_urn = urllib.parse.quote(video_urn, safe='')
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "X-Restli-Protocol-Version": "2.0.0",
-            "LinkedIn-Version": LINKEDIN_VERSION
-        }
-
-        response = requests.get(
-            f"{self.BASE_URL}/rest/videos/{encoded_urn}",
-            headers=headers
+        # Session headers already carry auth and versioning; a GET has no body
+        response = self.session.get(
+            f"{VIDEOS_URL}/{encoded_urn}",
+            headers={"Content-Type": None}
         )
         response.raise_for_status()
         data = response.json()
-        return data.get("status", "UNKNOWN")
 
-    def _wait_for_video_processing(self, video_urn: str, max_wait: int = 300, poll_interval: int = 5) -> bool:
-        """Wait for video processing to complete."""
-        elapsed = 0
-        while elapsed < max_wait:
-            status = self._check_video_status(video_urn)
-            print(f"  Video status: {status}")
+        try:
+            retry_after = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            retry_after = None
+
+        return data.get("status", "UNKNOWN"), retry_after
+
+    def _wait_for_video_processing(self, video_urn: str, max_wait: int = 300, max_interval: float = 15.0) -> bool:
+        """
+        Wait for video processing to complete.
+
+        Polls with exponential backoff and jitter, starting at 1 second, so
+        short videos are picked up quickly without hammering the API for long ones.
+        """
+        interval = 1.0
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
+            status, retry_after = self._check_video_status(video_urn)
+            logger.debug("  Video status: %s", status)
 
             if status == "AVAILABLE":
                 return True
             elif status == "PROCESSING_FAILED":
                 raise Exception("Video processing failed on LinkedIn")
 
-            time.sleep(poll_interval)
-            elapsed += poll_interval
+            delay = retry_after if retry_after is not None else interval + random.uniform(0, interval * 0.1)
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            interval = min(interval * 1.7, max_interval)
 
         raise Exception(f"Video processing timeout after {max_wait} seconds")
 
     def post_with_video(self, text: str, video_path: str, title: Optional[str] = None, description: Optional[str] = None) -> dict:
         """Post an update with a video attachment."""
-        # Get file size
-        file_size = os.path.getsize(video_path)
-        print(f"Uploading video: {video_path} ({file_size / 1024 / 1024:.1f} MB)")
+        # Validate and get file size
+        file_size, = _validate_files([video_path], MAX_VIDEO_BYTES, video=True)
+        logger.info("Uploading video: %s (%.1f MB)", video_path, file_size / 1024 / 1024)
+
+        author = self.get_user_profile()
 
         # Step 1: Initialize upload
-        print("  Initializing video upload...")
-        init_response = self._initialize_video_upload(file_size)
+        logger.debug("  Initializing video upload...")
+        init_response = self._initialize_video_upload(file_size, author)
         video_urn = init_response["video"]
         upload_instructions = init_response["uploadInstructions"]
         upload_token = init_response.get("uploadToken", "")
 
-        print(f"  Video URN: {video_urn}")
-        print(f"  Upload chunks: {len(upload_instructions)}")
+        logger.debug("  Video URN: %s", video_urn)
+        logger.debug("  Upload chunks: %d", len(upload_instructions))
 
         # Step 2: Upload chunks
-        print("  Uploading video chunks...")
+        logger.debug("  Uploading video chunks...")
         etags = self._upload_video_chunks(video_path, upload_instructions)
 
         # Step 3: Finalize upload
-        print("  Finalizing upload...")
+        logger.debug("  Finalizing upload...")
         self._finalize_video_upload(video_urn, upload_token, etags)
 
         # Step 4: Wait for processing
-        print("  Waiting for video processing...")
+        logger.debug("  Waiting for video processing...")
         self._wait_for_video_processing(video_urn)
 
         # Step 5: Create post with video using the Posts API
-        print("  Creating post...")
-        author = self.get_user_profile()
-
+        logger.debug("  Creating post...")
         payload = {
             "author": author,
             "commentary": text,
@@ -428,22 +593,12 @@ class LinkedInPoster:
         if title:
             payload["content"]["media"]["title"] = title
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-            "X-Restli-Protocol-Version": "2.0.0",
-            "LinkedIn-Version": LINKEDIN_VERSION
-        }
-
-        response = requests.post(
-            f"{self.BASE_URL}/rest/posts",
-            headers=headers,
-            json=payload
+        response = self.session.post(
+            POSTS_URL,
+            data=_json_body(payload)
         )
         response.raise_for_status()
-        # Response may be empty, get post ID from header
-        post_id = response.headers.get("x-restli-id", "posted")
-        return {"id": post_id}
+        return _extract_post_id(response)
 
 
 def main():
@@ -457,9 +612,16 @@ def main():
     parser.add_argument("--video", "-v", help="Path to video file")
     parser.add_argument("--title", help="Title for link/image/video")
     parser.add_argument("--description", "-d", help="Description for link/image/video")
+    parser.add_argument("--verbose", action="store_true", help="Show detailed upload progress")
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Only this module's upload progress; root DEBUG would also dump oauthlib
+    # and urllib3 request bodies and signed headers
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
     poster = LinkedInPoster()
 
     try:
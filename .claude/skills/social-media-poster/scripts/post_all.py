@@ -10,9 +10,12 @@ Supported platforms:
 """
 
 import os
+import sys
+import logging
 import argparse
+import functools
 from typing import Optional, List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -25,6 +28,31 @@ PLATFORMS = {
     # "facebook": False,   # Future
 }
 
+# Upper bound for a single platform to finish posting. Video posts include
+# upload and LinkedIn-side processing (up to 5 minutes), so this is generous.
+PLATFORM_TIMEOUT = 600
+
+# Shared worker pool for parallel posting, reused across post_to_all calls.
+# Its threads are joined at interpreter exit, so a post that is still in
+# flight after a timeout keeps the process alive until it returns (see main).
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="social")
+
+
+# Posters are created once per process and reused, so repeated posts keep
+# their pooled connections and cached user details. The underlying HTTP
+# sessions are safe to share across the worker threads in post_to_all.
+# Imports stay inside the factories so unused platforms are never loaded.
+@functools.lru_cache(maxsize=1)
+def _get_linkedin_poster():
+    from linkedin_poster import LinkedInPoster
+    return LinkedInPoster()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_twitter_poster():
+    from twitter_poster import TwitterPoster
+    return TwitterPoster()
+
 
 def post_to_linkedin(text: str, image_path: Optional[str] = None,
                      image_paths: Optional[List[str]] = None,
@@ -32,8 +60,7 @@ def post_to_linkedin(text: str, image_path: Optional[str] = None,
                      url: Optional[str] = None, title: Optional[str] = None) -> Dict:
     """Post to LinkedIn."""
     try:
-        from linkedin_poster import LinkedInPoster
-        poster = LinkedInPoster()
+        poster = _get_linkedin_poster()
 
         if video_path:
             result = poster.post_with_video(text, video_path, title=title)
@@ -68,8 +95,7 @@ def post_to_twitter(text: str, image_path: Optional[str] = None,
                     url: Optional[str] = None, title: Optional[str] = None) -> Dict:
     """Post to Twitter/X. Supports long-form posts for premium accounts."""
     try:
-        from twitter_poster import TwitterPoster
-        poster = TwitterPoster()
+        poster = _get_twitter_poster()
 
         # Append URL to text if provided (Twitter shows link previews automatically)
         full_text = f"{text}\n\n{url}" if url else text
@@ -116,6 +142,11 @@ PLATFORM_HANDLERS = {
     # "facebook": post_to_facebook,
 }
 
+PLATFORM_NAMES = {
+    "linkedin": "LinkedIn",
+    "twitter": "Twitter",
+}
+
 
 def post_to_all(
     text: str,
@@ -125,7 +156,8 @@ def post_to_all(
     video_path: Optional[str] = None,
     url: Optional[str] = None,
     title: Optional[str] = None,
-    parallel: bool = True
+    parallel: bool = True,
+    timeout: Optional[float] = PLATFORM_TIMEOUT
 ) -> List[Dict]:
     """
     Post content to multiple social media platforms.
@@ -139,6 +171,8 @@ def post_to_all(
         url: Optional URL to include
         title: Optional title for link/image/video
         parallel: Whether to post to platforms in parallel
+        timeout: Seconds to wait for parallel posts before reporting the
+            remaining platforms as timed out (None waits indefinitely)
 
     Returns:
         List of result dictionaries for each platform
@@ -153,24 +187,41 @@ def post_to_all(
     results = []
 
     if parallel:
-        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
-            futures = {}
-            for platform in platforms:
-                if platform in PLATFORM_HANDLERS:
-                    handler = PLATFORM_HANDLERS[platform]
-                    future = executor.submit(
-                        handler,
-                        text=text,
-                        image_path=image_paths[0] if image_paths and len(image_paths) == 1 else None,
-                        image_paths=image_paths if image_paths and len(image_paths) > 0 else None,
-                        video_path=video_path,
-                        url=url,
-                        title=title
-                    )
-                    futures[future] = platform
-
-            for future in as_completed(futures):
+        futures = {}
+        for platform in platforms:
+            if platform in PLATFORM_HANDLERS:
+                handler = PLATFORM_HANDLERS[platform]
+                future = _EXECUTOR.submit(
+                    handler,
+                    text=text,
+                    image_path=image_paths[0] if image_paths and len(image_paths) == 1 else None,
+                    image_paths=image_paths if image_paths and len(image_paths) > 0 else None,
+                    video_path=video_path,
+                    url=url,
+                    title=title
+                )
+                futures[future] = platform
+
+        try:
+            for future in as_completed(futures, timeout=timeout):
                 results.append(future.result())
+        except TimeoutError:
+            # Platforms still running are reported as failed. A call that has
+            # already started cannot be interrupted: it keeps running in its
+            # worker thread and its post may still be published.
+            for future, platform in futures.items():
+                if not future.done():
+                    if future.cancel():
+                        error = f"Timed out after {timeout} seconds before posting started"
+                    else:
+                        error = (f"Timed out after {timeout} seconds; the request is "
+                                 f"still running and the post may still be published")
+                    results.append({
+                        "platform": PLATFORM_NAMES.get(platform, platform),
+                        "success": False,
+                        "error": error,
+                        "timed_out": True
+                    })
     else:
         for platform in platforms:
             if platform in PLATFORM_HANDLERS:
@@ -209,9 +260,20 @@ def main():
         action="store_true",
         help="Post sequentially instead of in parallel"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show detailed upload progress"
+    )
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Only our own upload progress; root DEBUG would also dump oauthlib and
+    # urllib3 request bodies and signed headers
+    if args.verbose:
+        logging.getLogger("linkedin_poster").setLevel(logging.DEBUG)
+
     print("=" * 50)
     print("Posting to social media platforms...")
     print("=" * 50)
@@ -245,6 +307,13 @@ def main():
     print("-" * 50)
     print(f"Summary: {success_count}/{len(results)} platforms succeeded")
 
+    # A timed-out post is still running in a worker thread, and normal
+    # interpreter shutdown would join it; exit now instead of hanging.
+    if any(result.get("timed_out") for result in results):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
+
 
 if __name__ == "__main__":
     main()
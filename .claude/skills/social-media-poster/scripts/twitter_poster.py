@@ -5,13 +5,83 @@ Posts text, images, and videos to your Twitter/X account.
 """
 
 import os
+import json
+import mmap
+import struct
 import time
+import random
+import subprocess
+import requests
 import tweepy
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Optional, List
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# h264_nvenc settings, used when ffmpeg can encode on an NVIDIA GPU
+NVENC_PRESET = os.getenv("TWITTER_NVENC_PRESET", "p4")
+NVENC_CQ = os.getenv("TWITTER_NVENC_CQ", "23")
+
+# v1.1 media upload endpoint, called directly so video APPENDs can run in parallel
+MEDIA_UPLOAD_URL = "https://upload.twitter.com/1.1/media/upload.json"
+VIDEO_CHUNK_SIZE = 4 * 1024 * 1024
+MAX_PARALLEL_CHUNKS = 8
+# Per-request timeout in seconds, matching tweepy.API's default
+UPLOAD_TIMEOUT = 60
+
+# What _transcode_video_for_twitter produces; inputs already matching skip the transcode
+TWITTER_VIDEO_PROFILES = frozenset({"High", "Main", "Baseline", "Constrained Baseline"})
+
+
+def _probe_video(video_path: str) -> Optional[dict]:
+    """Return ffprobe's stream and format info for a file, or None if it can't be probed."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "stream=codec_type,codec_name,profile,pix_fmt,width,height",
+                "-show_entries", "format_tags=major_brand",
+                "-of", "json", video_path
+            ],
+            capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        return json.loads(result.stdout)
+    except ValueError:
+        return None
+
+
+def _moov_before_mdat(video_path: str) -> bool:
+    """Walk the top-level MP4 boxes and report whether the moov atom precedes mdat (faststart)."""
+    with open(video_path, "rb") as f:
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return False
+            size, box_type = struct.unpack(">I4s", header)
+            if box_type == b"moov":
+                return True
+            if box_type == b"mdat":
+                return False
+            if size == 1:
+                largesize = f.read(8)
+                if len(largesize) < 8:
+                    return False
+                size = struct.unpack(">Q", largesize)[0] - 16
+            else:
+                # 0 (box runs to end of file) or too small to hold its own header
+                size -= 8
+            # A negative remainder would seek backwards and could loop forever
+            if size < 0:
+                return False
+            f.seek(size, os.SEEK_CUR)
+
 
 class TwitterPoster:
     """Handles posting content to Twitter/X via the API."""
@@ -38,6 +108,11 @@ class TwitterPoster:
         )
         self.api_v1 = tweepy.API(self.auth)
 
+        # OAuth 1.0a-signed session for direct chunked video uploads
+        self.upload_session = requests.Session()
+        self.upload_session.auth = self.auth.apply_auth()
+        self.upload_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PARALLEL_CHUNKS))
+
         # Set up v2 client for tweets
         self.client = tweepy.Client(
             bearer_token=self.bearer_token,
@@ -47,15 +122,28 @@ class TwitterPoster:
             access_token_secret=self.access_token_secret
         )
 
+        # Probed on first transcode
+        self._nvenc_available = None
+
     def post_text(self, text: str) -> dict:
         """Post a text-only tweet."""
         response = self.client.create_tweet(text=text)
         return {"id": response.data["id"], "text": text}
 
+    def _media_upload(self, image_path: str, attempts: int = 3):
+        """Upload media via the v1.1 API, retrying rate limits and server errors."""
+        for attempt in range(attempts):
+            try:
+                return self.api_v1.media_upload(image_path)
+            except (tweepy.TooManyRequests, tweepy.TwitterServerError):
+                if attempt == attempts - 1:
+                    raise
+                time.sleep(2 ** attempt + random.uniform(0, 0.5))
+
     def post_with_image(self, text: str, image_path: str) -> dict:
         """Post a tweet with an image attachment."""
         # Upload media using v1.1 API
-        media = self.api_v1.media_upload(image_path)
+        media = self._media_upload(image_path)
 
         # Create tweet with media using v2 API
         response = self.client.create_tweet(
@@ -69,11 +157,9 @@ class TwitterPoster:
         if len(image_paths) > 4:
             raise ValueError("Twitter allows maximum 4 images per tweet")
 
-        # Upload all media
-        media_ids = []
-        for path in image_paths:
-            media = self.api_v1.media_upload(path)
-            media_ids.append(media.media_id)
+        # Upload all media concurrently (map keeps the display order)
+        with ThreadPoolExecutor(max_workers=len(image_paths) or 1) as executor:
+            media_ids = [media.media_id for media in executor.map(self._media_upload, image_paths)]
 
         # Create tweet with media
         response = self.client.create_tweet(
@@ -82,18 +168,49 @@ class TwitterPoster:
         )
         return {"id": response.data["id"], "text": text, "media_ids": media_ids}
 
-    def _transcode_video_for_twitter(self, video_path: str) -> str:
+    def _has_nvenc(self) -> bool:
+        """Check (once) whether ffmpeg was built with the h264_nvenc encoder."""
+        if self._nvenc_available is None:
+            try:
+                result = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-encoders"],
+                    capture_output=True, text=True
+                )
+                self._nvenc_available = "h264_nvenc" in result.stdout
+            except OSError:
+                self._nvenc_available = False
+        return self._nvenc_available
+
+    def _transcode_cmd(self, video_path: str, output_path: str, nvenc: bool = False, scale: bool = True) -> list:
         """
-        Transcode video to Twitter-compatible format using ffmpeg.
-        Returns path to the transcoded video (in /tmp).
+        Build the ffmpeg command for a Twitter-compatible H.264/AAC MP4.
+        Output is always yuv420p; the even-dimension scale is only added
+        when scale is True.
         """
-        import subprocess
-        import tempfile
-
-        basename = os.path.splitext(os.path.basename(video_path))[0]
-        output_path = f"/tmp/{basename}_twitter.mp4"
+        if nvenc:
+            # Decode, scale and encode on the GPU so frames stay in video memory
+            cmd = [
+                "ffmpeg", "-y",
+                "-hwaccel", "cuda", "-hwaccel_output_format", "cuda",
+                "-i", video_path,
+                "-c:v", "h264_nvenc",
+                "-preset", NVENC_PRESET,
+                "-tune", "hq",
+                "-rc", "vbr", "-cq", NVENC_CQ, "-b:v", "0",
+                "-profile:v", "high",
+                "-level", "4.0",
+                "-c:a", "aac",
+                "-b:a", "128k",
+                "-movflags", "+faststart"
+            ]
+            # Convert on the GPU too, so 10-bit or 4:2:2 sources come out
+            # yuv420p like the CPU path
+            if scale:
+                cmd += ["-vf", "scale_cuda=trunc(iw/2)*2:trunc(ih/2)*2:format=yuv420p"]
+            else:
+                cmd += ["-vf", "scale_cuda=format=yuv420p"]
+            return cmd + [output_path]
 
-        print("  Transcoding video for Twitter compatibility...")
         cmd = [
             "ffmpeg", "-y", "-i", video_path,
             "-c:v", "libx264",        # H.264 video codec
@@ -103,10 +220,64 @@ class TwitterPoster:
             "-c:a", "aac",            # AAC audio codec
             "-b:a", "128k",           # Audio bitrate
             "-movflags", "+faststart", # Enable streaming
-            "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2",  # Ensure even dimensions
-            output_path
         ]
+        if scale:
+            cmd += ["-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2"]  # Ensure even dimensions
+        return cmd + [output_path]
 
+    def _is_twitter_compatible(self, video_path: str, info: Optional[dict] = None) -> bool:
+        """
+        Check whether a video already matches what the transcode would produce:
+        an MP4 with H.264 (High/Main/Baseline) yuv420p video at even dimensions,
+        AAC audio (if any) and the moov atom up front.
+        """
+        info = info or _probe_video(video_path)
+        if not info:
+            return False
+        if info.get("format", {}).get("tags", {}).get("major_brand", "").strip() == "qt":
+            return False
+
+        streams = info.get("streams", [])
+        video = [st for st in streams if st.get("codec_type") == "video"]
+        audio = [st for st in streams if st.get("codec_type") == "audio"]
+        if len(video) != 1 or any(st.get("codec_name") != "aac" for st in audio):
+            return False
+
+        v = video[0]
+        width, height = v.get("width", 1), v.get("height", 1)
+        if (v.get("codec_name") != "h264"
+                or v.get("profile") not in TWITTER_VIDEO_PROFILES
+                or v.get("pix_fmt") != "yuv420p"
+                or width % 2 or height % 2):
+            return False
+
+        return _moov_before_mdat(video_path)
+
+    def _transcode_video_for_twitter(self, video_path: str, info: Optional[dict] = None) -> str:
+        """
+        Transcode video to Twitter-compatible format using ffmpeg.
+        Uses NVENC when available, falling back to libx264. The scale filter
+        is skipped when ffprobe info shows the dimensions are already even.
+        Returns path to the transcoded video (in /tmp).
+        """
+        basename = os.path.splitext(os.path.basename(video_path))[0]
+        output_path = f"/tmp/{basename}_twitter.mp4"
+
+        video = next((st for st in (info or {}).get("streams", []) if st.get("codec_type") == "video"), {})
+        scale = bool(video.get("width", 1) % 2 or video.get("height", 1) % 2)
+
+        print("  Transcoding video for Twitter compatibility...")
+        if self._has_nvenc():
+            cmd = self._transcode_cmd(video_path, output_path, nvenc=True, scale=scale)
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                print(f"  Transcoded (NVENC) to: {output_path}")
+                return output_path
+            # Encoder present but no usable GPU/driver: stick to the CPU from now on
+            print("  NVENC transcode failed, falling back to libx264...")
+            self._nvenc_available = False
+
+        cmd = self._transcode_cmd(video_path, output_path, scale=scale)
         result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
             print(f"  FFmpeg error: {result.stderr}")
@@ -115,40 +286,100 @@ class TwitterPoster:
         print(f"  Transcoded to: {output_path}")
         return output_path
 
+    def _media_upload_command(self, **data) -> dict:
+        """POST a media/upload.json command (INIT, FINALIZE) and return the JSON response."""
+        response = self.upload_session.post(MEDIA_UPLOAD_URL, data=data, timeout=UPLOAD_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    def _append_video_chunk(self, media_id: str, video_data: mmap.mmap, segment_index: int) -> None:
+        """Upload one segment of a chunked video upload."""
+        start = segment_index * VIDEO_CHUNK_SIZE
+        response = self.upload_session.post(
+            MEDIA_UPLOAD_URL,
+            data={"command": "APPEND", "media_id": media_id, "segment_index": segment_index},
+            files={"media": video_data[start:start + VIDEO_CHUNK_SIZE]},
+            timeout=UPLOAD_TIMEOUT
+        )
+        response.raise_for_status()
+
+    def _wait_for_media_processing(self, media_id: str, processing_info: Optional[dict]) -> Optional[dict]:
+        """Poll STATUS until Twitter finishes processing; returns the final processing_info."""
+        while processing_info and processing_info.get("state") in ("pending", "in_progress"):
+            time.sleep(processing_info.get("check_after_secs", 1))
+            response = self.upload_session.get(
+                MEDIA_UPLOAD_URL,
+                params={"command": "STATUS", "media_id": media_id},
+                timeout=UPLOAD_TIMEOUT
+            )
+            response.raise_for_status()
+            processing_info = response.json().get("processing_info")
+        return processing_info
+
+    def _chunked_upload(self, video_path: str) -> int:
+        """
+        INIT, APPEND and FINALIZE a video via media/upload.json, sending the
+        APPEND segments concurrently. Returns the media_id once processed.
+        """
+        with open(video_path, "rb") as f:
+            total_bytes = os.fstat(f.fileno()).st_size
+            init = self._media_upload_command(
+                command="INIT",
+                total_bytes=total_bytes,
+                media_type="video/mp4",
+                media_category="tweet_video"
+            )
+            media_id = init["media_id_string"]
+
+            segments = -(-total_bytes // VIDEO_CHUNK_SIZE)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as video_data, \
+                    ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CHUNKS, segments)) as executor:
+                # list() re-raises the first failed APPEND
+                list(executor.map(
+                    lambda segment_index: self._append_video_chunk(media_id, video_data, segment_index),
+                    range(segments)
+                ))
+
+        print(f"  Uploaded {total_bytes / 1024 / 1024:.1f} MB")
+
+        finalize = self._media_upload_command(command="FINALIZE", media_id=media_id)
+        processing_info = self._wait_for_media_processing(media_id, finalize.get("processing_info"))
+
+        # Check if processing succeeded
+        if processing_info and processing_info.get("state") == "failed":
+            error = processing_info.get("error", {})
+            raise Exception(f"Twitter video processing failed: {error.get('message', 'Unknown error')}")
+
+        return int(media_id)
+
     def _upload_video_chunked(self, video_path: str) -> int:
         """
         Upload a video using chunked upload.
         Returns the media_id for use in tweets.
         """
-        file_size = os.path.getsize(video_path)
-        print(f"Uploading video: {video_path} ({file_size / 1024 / 1024:.1f} MB)")
+        print(f"Uploading video: {video_path}")
 
-        # Transcode video to ensure Twitter compatibility
-        transcoded_path = self._transcode_video_for_twitter(video_path)
+        # Transcode video to ensure Twitter compatibility, unless it already is
+        info = _probe_video(video_path)
+        if self._is_twitter_compatible(video_path, info):
+            print("  Video already Twitter-compatible, skipping transcode")
+            transcoded_path = video_path
+        else:
+            transcoded_path = self._transcode_video_for_twitter(video_path, info)
 
-        # Use tweepy's chunked_upload which handles INIT, APPEND, FINALIZE
         print("  Uploading video chunks...")
-        media = self.api_v1.chunked_upload(
-            transcoded_path,
-            file_type='video/mp4',
-            media_category='tweet_video',
-            wait_for_async_finalize=True
-        )
-
-        # Check if processing succeeded
-        processing_info = getattr(media, 'processing_info', None)
-        if processing_info and processing_info.get('state') == 'failed':
-            error = processing_info.get('error', {})
-            raise Exception(f"Twitter video processing failed: {error.get('message', 'Unknown error')}")
-
-        # Clean up transcoded file
         try:
-            os.remove(transcoded_path)
-        except:
-            pass
-
-        print(f"  Video uploaded! Media ID: {media.media_id}")
-        return media.media_id
+            media_id = self._chunked_upload(transcoded_path)
+        finally:
+            # Clean up transcoded file (never the caller's original)
+            if transcoded_path != video_path:
+                try:
+                    os.remove(transcoded_path)
+                except OSError:
+                    pass
+
+        print(f"  Video uploaded! Media ID: {media_id}")
+        return media_id
 
     def post_with_video(self, text: str, video_path: str) -> dict:
         """Post a tweet with a video attachment."""
@@ -226,7 +457,7 @@ def main():
             print(f"Posted! Tweet ID: {result['id']}")
 
         print(f"View at: https://twitter.com/i/status/{result['id']}")
-    except tweepy.TweepyException as e:
+    except (tweepy.TweepyException, requests.exceptions.RequestException) as e:
         print(f"Error posting: {e}")
 
 
@@ -8,14 +8,25 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import re
-import subprocess
 import sys
 import tempfile
-import urllib.request
-import urllib.parse
+import uuid
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+import requests
+from dotenv import dotenv_values
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional: host call audio in S3 instead of tmpfiles.org
+    import boto3
+except ImportError:
+    boto3 = None
 
 # Default configuration
 DEFAULT_VOICE = "charlie"
@@ -23,8 +34,22 @@ DEFAULT_MODEL = "eleven_v3"
 DEFAULT_FROM_AU = "+61348279516"
 DEFAULT_FROM_US = "+19788785597"
 
-# Available voices
-VOICES = {
+# Streaming endpoint: audio is sent as it is synthesised
+ELEVENLABS_TTS_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream?output_format=mp3_44100_128"
+TWILIO_API_URL = "https://api.twilio.com/2010-04-01/Accounts/{sid}/{resource}.json"
+
+# Concurrent requests when sending one SMS to many numbers
+SMS_BATCH_WORKERS = 8
+
+# Keep-alive pool shared by ElevenLabs, tmpfiles.org and Twilio calls, sized for batch SMS
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=SMS_BATCH_WORKERS))
+
+# Presigned S3 audio URLs must outlive ringing time before Twilio fetches them
+AUDIO_URL_EXPIRY = 3600
+
+# Available voices (read-only)
+VOICES = MappingProxyType({
     "charlie": {"id": "IKne3meq5aSn9XLyUdCD", "accent": "Australian"},
     "george": {"id": "JBFqnCBsd6RMkjVDRZzb", "accent": "British"},
     "alice": {"id": "Xb7hH8MSUJpSbSDYk0k2", "accent": "British"},
@@ -32,14 +57,24 @@ VOICES = {
     "roger": {"id": "CwhRBWXzGAHq8TQ4Fs17", "accent": "American"},
     "laura": {"id": "FGY2WhTYpPnrIDTdsKH5", "accent": "American"},
     "matilda": {"id": "XrExE9yKIg1WjnnlVkGX", "accent": "American"},
-}
+})
+_VOICE_NAMES = tuple(VOICES)
 
+# Separators stripped from phone numbers before normalising
+_PHONE_STRIP_RE = re.compile(r"[\s\-()]")
 
-def get_api_key():
-    """Get ElevenLabs API key from environment or .env file."""
-    api_key = os.environ.get("ELEVENLABS_API_KEY")
-    if api_key:
-        return api_key
+
+@lru_cache(maxsize=8)
+def _load_env_file(env_path: str, mtime: float) -> dict:
+    """Parse a .env file; keyed on mtime so edits are picked up."""
+    return dotenv_values(env_path)
+
+
+def get_env(name: str):
+    """Get a setting from the environment or a .env file."""
+    value = os.environ.get(name)
+    if value:
+        return value
 
     # Try loading from .env file
     env_paths = [
@@ -48,19 +83,26 @@ def get_api_key():
     ]
 
     for env_path in env_paths:
-        if os.path.exists(env_path):
-            with open(env_path, "r") as f:
-                for line in f:
-                    if line.startswith("ELEVENLABS_API_KEY="):
-                        return line.split("=", 1)[1].strip().strip('"').strip("'")
+        try:
+            mtime = os.stat(env_path).st_mtime
+        except OSError:
+            continue
+        value = _load_env_file(env_path, mtime).get(name)
+        if value:
+            return value
 
     return None
 
 
+def get_api_key():
+    """Get ElevenLabs API key from environment or .env file."""
+    return get_env("ELEVENLABS_API_KEY")
+
+
 def normalise_phone_number(phone: str) -> str:
     """Convert phone number to E.164 format."""
     # Remove spaces and dashes
-    phone = re.sub(r"[\s\-()]", "", phone)
+    phone = _PHONE_STRIP_RE.sub("", phone)
 
     # Australian mobile starting with 04
     if phone.startswith("04") and len(phone) == 10:
@@ -78,115 +120,216 @@ def normalise_phone_number(phone: str) -> str:
     return "+61" + phone
 
 
-def generate_audio(text: str, voice_id: str, api_key: str, output_path: str) -> bool:
-    """Generate audio using ElevenLabs API."""
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}?output_format=mp3_44100_128"
-
-    data = json.dumps({
+def request_audio(text: str, voice_id: str, api_key: str) -> requests.Response:
+    """Start a streaming ElevenLabs text-to-speech request; the caller consumes and closes it."""
+    payload = {
         "text": text,
         "model_id": DEFAULT_MODEL,
         "voice_settings": {
             "stability": 0.5,
             "similarity_boost": 0.75
         }
-    }).encode("utf-8")
-
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={
-            "xi-api-key": api_key,
-            "Content-Type": "application/json"
-        }
+    }
+    return _HTTP.post(
+        ELEVENLABS_TTS_URL.format(voice_id=voice_id),
+        json=payload,
+        headers={"xi-api-key": api_key},
+        stream=True
     )
 
+
+def generate_audio(text: str, voice_id: str, api_key: str, output_path: str) -> bool:
+    """Generate audio using ElevenLabs API."""
     try:
-        with urllib.request.urlopen(req) as response:
+        with request_audio(text, voice_id, api_key) as response:
+            if not response.ok:
+                print(f"Error generating audio: {response.status_code} - {response.text}", file=sys.stderr)
+                return False
+            # Stream to disk in 64 KB chunks instead of buffering the whole MP3
             with open(output_path, "wb") as f:
-                f.write(response.read())
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
         return True
-    except urllib.error.HTTPError as e:
-        print(f"Error generating audio: {e.code} - {e.read().decode()}", file=sys.stderr)
+    except requests.exceptions.RequestException as e:
+        print(f"Error generating audio: {e}", file=sys.stderr)
         return False
 
 
-def upload_audio(file_path: str) -> str:
-    """Upload audio file to tmpfiles.org and return direct URL."""
-    # Use curl for multipart upload (simpler than urllib)
-    result = subprocess.run(
-        ["curl", "-s", "-X", "POST", "-F", f"file=@{file_path}", "https://tmpfiles.org/api/v1/upload"],
-        capture_output=True,
-        text=True
+def _audio_s3_key(filename: str) -> str:
+    return f"{get_env('AUDIO_S3_PREFIX') or 'voice-calls/'}{filename}"
+
+
+def _presigned_audio_url(s3, bucket: str, key: str) -> str:
+    return s3.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": bucket, "Key": key},
+        ExpiresIn=AUDIO_URL_EXPIRY
     )
 
-    if result.returncode != 0:
-        print(f"Error uploading file: {result.stderr}", file=sys.stderr)
+
+def upload_audio_s3(file_path: str, bucket: str) -> str:
+    """Upload audio file to S3 and return a presigned URL Twilio can fetch."""
+    s3 = boto3.client("s3")
+    key = _audio_s3_key(os.path.basename(file_path))
+
+    try:
+        with open(file_path, "rb") as f:
+            s3.put_object(Bucket=bucket, Key=key, Body=f, ContentType="audio/mpeg")
+        return _presigned_audio_url(s3, bucket, key)
+    except Exception as e:
+        print(f"Error uploading file to S3: {e}", file=sys.stderr)
         return None
 
+
+def stream_audio_to_s3(text: str, voice_id: str, api_key: str, bucket: str) -> str:
+    """
+    Upload ElevenLabs' audio response to S3 without a temp file and return
+    a presigned URL Twilio can fetch.
+
+    upload_fileobj buffers the stream in memory up to its multipart
+    threshold (8 MiB), so a call clip is read in full and then sent in a
+    single PUT; it never touches disk and is held in memory only once.
+    """
+    s3 = boto3.client("s3")
+    key = _audio_s3_key(f"{uuid.uuid4().hex}.mp3")
+
     try:
-        response = json.loads(result.stdout)
+        with request_audio(text, voice_id, api_key) as response:
+            if not response.ok:
+                print(f"Error generating audio: {response.status_code} - {response.text}", file=sys.stderr)
+                return None
+            response.raw.decode_content = True
+            s3.upload_fileobj(response.raw, bucket, key, ExtraArgs={"ContentType": "audio/mpeg"})
+        return _presigned_audio_url(s3, bucket, key)
+    except requests.exceptions.RequestException as e:
+        print(f"Error generating audio: {e}", file=sys.stderr)
+        return None
+    except Exception as e:
+        print(f"Error uploading audio to S3: {e}", file=sys.stderr)
+        return None
+
+
+def generate_and_upload(text: str, voice_id: str, api_key: str) -> str:
+    """
+    Generate call audio and return a URL Twilio can play.
+
+    With S3 configured the audio response is uploaded to the bucket from
+    memory; otherwise it is generated to a temp file and uploaded with
+    upload_audio.
+    """
+    bucket = get_env("AUDIO_S3_BUCKET")
+    if bucket and boto3 is not None:
+        print("Generating audio and uploading to S3...")
+        return stream_audio_to_s3(text, voice_id, api_key, bucket)
+
+    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+        audio_path = f.name
+
+    if not generate_audio(text, voice_id, api_key, audio_path):
+        return None
+
+    print(f"Audio generated: {audio_path}")
+
+    # Upload audio
+    print("Uploading audio...")
+    return upload_audio(audio_path)
+
+
+def upload_audio(file_path: str) -> str:
+    """
+    Upload audio file and return a direct URL for Twilio to play.
+
+    Uses S3 when AUDIO_S3_BUCKET is set (requires boto3), otherwise tmpfiles.org.
+    """
+    bucket = get_env("AUDIO_S3_BUCKET")
+    if bucket:
+        if boto3 is not None:
+            return upload_audio_s3(file_path, bucket)
+        print("Warning: AUDIO_S3_BUCKET is set but boto3 is not installed, using tmpfiles.org", file=sys.stderr)
+
+    try:
+        with open(file_path, "rb") as f:
+            result = _HTTP.post(
+                "https://tmpfiles.org/api/v1/upload",
+                files={"file": (os.path.basename(file_path), f, "audio/mpeg")}
+            )
+        result.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"Error uploading file: {e}", file=sys.stderr)
+        return None
+
+    try:
+        response = result.json()
         url = response["data"]["url"]
         # Convert to direct download URL
         # http://tmpfiles.org/XXXXXX/file.mp3 -> https://tmpfiles.org/dl/XXXXXX/file.mp3
         direct_url = url.replace("http://tmpfiles.org/", "https://tmpfiles.org/dl/")
         return direct_url
-    except (json.JSONDecodeError, KeyError) as e:
+    except (ValueError, KeyError) as e:
         print(f"Error parsing upload response: {e}", file=sys.stderr)
         return None
 
 
-def make_call(from_number: str, to_number: str, audio_url: str) -> dict:
-    """Make a phone call using Twilio CLI."""
-    twiml = f"<Response><Play>{audio_url}</Play></Response>"
-
-    result = subprocess.run(
-        [
-            "twilio", "api:core:calls:create",
-            "--from", from_number,
-            "--to", to_number,
-            "--twiml", twiml,
-            "-o", "json"
-        ],
-        capture_output=True,
-        text=True
-    )
+def get_twilio_credentials() -> tuple:
+    """Get Twilio account SID and auth token from environment or .env file."""
+    return get_env("TWILIO_ACCOUNT_SID"), get_env("TWILIO_AUTH_TOKEN")
+
 
-    if result.returncode != 0:
-        print(f"Error making call: {result.stderr}", file=sys.stderr)
+def twilio_post(resource: str, data: dict, action: str) -> dict:
+    """POST to a Twilio account resource (Calls, Messages) and return the created record."""
+    sid, token = get_twilio_credentials()
+    if not sid or not token:
+        print("Error: TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN not found in environment or .env file", file=sys.stderr)
         return None
 
     try:
-        # Twilio CLI returns array
-        calls = json.loads(result.stdout)
-        return calls[0] if calls else None
-    except json.JSONDecodeError:
-        # Try parsing as plain output
-        return {"output": result.stdout}
+        response = _HTTP.post(
+            TWILIO_API_URL.format(sid=sid, resource=resource),
+            data=data,
+            auth=(sid, token)
+        )
+    except requests.exceptions.RequestException as e:
+        print(f"Error {action}: {e}", file=sys.stderr)
+        return None
+
+    if not response.ok:
+        try:
+            detail = response.json().get("message", response.text)
+        except ValueError:
+            detail = response.text
+        print(f"Error {action}: {response.status_code} - {detail}", file=sys.stderr)
+        return None
+
+    return response.json()
+
+
+def make_call(from_number: str, to_number: str, audio_url: str) -> dict:
+    """Make a phone call using the Twilio REST API."""
+    # Presigned URLs carry query strings; '&' must be escaped inside TwiML
+    twiml = f"<Response><Play>{escape(audio_url)}</Play></Response>"
+    return twilio_post("Calls", {"From": from_number, "To": to_number, "Twiml": twiml}, "making call")
 
 
 def send_sms(from_number: str, to_number: str, message: str) -> dict:
-    """Send SMS using Twilio CLI."""
-    result = subprocess.run(
-        [
-            "twilio", "api:core:messages:create",
-            "--from", from_number,
-            "--to", to_number,
-            "--body", message,
-            "-o", "json"
-        ],
-        capture_output=True,
-        text=True
-    )
+    """Send SMS using the Twilio REST API. from_number may be a Messaging Service SID (MG...)."""
+    sender = "MessagingServiceSid" if from_number.startswith("MG") else "From"
+    return twilio_post("Messages", {sender: from_number, "To": to_number, "Body": message}, "sending SMS")
 
-    if result.returncode != 0:
-        print(f"Error sending SMS: {result.stderr}", file=sys.stderr)
-        return None
 
-    try:
-        messages = json.loads(result.stdout)
-        return messages[0] if messages else None
-    except json.JSONDecodeError:
-        return {"output": result.stdout}
+def send_sms_batch(from_number: str, to_numbers: list, message: str) -> list:
+    """
+    Send the same SMS to many numbers concurrently over the shared connection pool.
+    Returns one result per number, in order (None where sending failed).
+    """
+    with ThreadPoolExecutor(max_workers=min(SMS_BATCH_WORKERS, len(to_numbers)) or 1) as executor:
+        return list(executor.map(lambda to_number: send_sms(from_number, to_number, message), to_numbers))
+
+
+def read_phone_list(path: str) -> list:
+    """Read phone numbers (one per line, # comments allowed) and normalise them."""
+    with open(path) as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [normalise_phone_number(line) for line in lines if line]
 
 
 def main():
@@ -194,11 +337,12 @@ def main():
         description="Make phone calls with natural AI voices using ElevenLabs and Twilio"
     )
     parser.add_argument("--to", help="Phone number to call (E.164 or Australian format)")
+    parser.add_argument("--to-list", help="File of phone numbers, one per line, to send the SMS to (with --sms)")
     parser.add_argument("--message", help="Message to speak")
-    parser.add_argument("--voice", default=DEFAULT_VOICE, choices=list(VOICES.keys()),
+    parser.add_argument("--voice", default=DEFAULT_VOICE, choices=_VOICE_NAMES,
                         help=f"Voice to use (default: {DEFAULT_VOICE})")
     parser.add_argument("--from-us", action="store_true", help="Use US number instead of Australian")
-    parser.add_argument("--from-number", help="Custom from number (overrides --from-us)")
+    parser.add_argument("--from-number", help="Custom from number or Messaging Service SID (overrides --from-us)")
     parser.add_argument("--sms", action="store_true", help="Send SMS instead of making a call")
     parser.add_argument("--list-voices", action="store_true", help="List available voices")
 
@@ -211,9 +355,12 @@ def main():
         return 0
 
     # Validate required args for call/sms
-    if not args.to or not args.message:
+    if not (args.to or args.to_list) or not args.message:
         parser.error("--to and --message are required for calls and SMS")
         return 1
+    if args.to_list and not args.sms:
+        parser.error("--to-list is only supported with --sms")
+        return 1
 
     # Determine from number
     if args.from_number:
@@ -223,6 +370,27 @@ def main():
     else:
         from_number = DEFAULT_FROM_AU
 
+    # Fail before generating any audio if Twilio isn't configured
+    if not all(get_twilio_credentials()):
+        print("Error: TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN not found in environment or .env file", file=sys.stderr)
+        return 1
+
+    # Batch SMS mode
+    if args.to_list:
+        to_numbers = read_phone_list(args.to_list)
+        if args.to:
+            to_numbers.insert(0, normalise_phone_number(args.to))
+        print(f"Sending SMS to {len(to_numbers)} numbers...")
+        results = send_sms_batch(from_number, to_numbers, args.message)
+        for number, result in zip(to_numbers, results):
+            if result:
+                print(f"  {number}: sent (SID: {result.get('sid', 'unknown')})")
+            else:
+                print(f"  {number}: failed")
+        sent = sum(1 for result in results if result)
+        print(f"SMS sent to {sent}/{len(to_numbers)} numbers")
+        return 0 if sent == len(to_numbers) else 1
+
     # Normalise to number
     to_number = normalise_phone_number(args.to)
 
@@ -244,18 +412,8 @@ def main():
     voice_info = VOICES[args.voice]
     print(f"Generating audio with {args.voice} ({voice_info['accent']}) voice...")
 
-    # Generate audio
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-        audio_path = f.name
-
-    if not generate_audio(args.message, voice_info["id"], api_key, audio_path):
-        return 1
-
-    print(f"Audio generated: {audio_path}")
-
-    # Upload audio
-    print("Uploading audio...")
-    audio_url = upload_audio(audio_path)
+    # Generate and host audio
+    audio_url = generate_and_upload(args.message, voice_info["id"], api_key)
     if not audio_url:
         return 1
 